@@ -8,6 +8,7 @@ Supports both SSDP discovery (for native installs) and subnet scanning (for Dock
 import logging
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from backend.app.services.discovery import (
@@ -96,28 +97,20 @@ async def stop_discovery():
 @router.get("/printers", response_model=list[DiscoveredPrinterResponse])
 async def get_discovered_printers():
     """Get list of discovered printers (from both SSDP and subnet scan)."""
-    # Combine results from both discovery methods
+    # Combine results from both discovery methods. The services keep their
+    # payloads already in response shape, so skip re-validating them here.
     printers = {}
 
     # Add SSDP discovered printers
-    for p in discovery_service.discovered_printers:
-        printers[p.ip_address] = p
-
-    # Add subnet scan discovered printers (may override if same IP)
-    for p in subnet_scanner.discovered_printers:
-        if p.ip_address not in printers:
-            printers[p.ip_address] = p
-
-    return [
-        DiscoveredPrinterResponse(
-            serial=p.serial,
-            name=p.name,
-            ip_address=p.ip_address,
-            model=p.model,
-            discovered_at=p.discovered_at,
-        )
-        for p in printers.values()
-    ]
+    for p in discovery_service.get_response_payload():
+        printers[p["ip_address"]] = p
+
+    # Add subnet scan discovered printers (SSDP wins if same IP)
+    for p in subnet_scanner.get_response_payload():
+        if p["ip_address"] not in printers:
+            printers[p["ip_address"]] = p
+
+    return JSONResponse(content=list(printers.values()))
 
 
 # Subnet scanning endpoints (for Docker environments)
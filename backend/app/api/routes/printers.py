@@ -37,9 +37,15 @@ router = APIRouter(prefix="/printers", tags=["printers"])
 
 
 @router.get("/", response_model=list[PrinterResponse])
-async def list_printers(db: AsyncSession = Depends(get_db)):
+async def list_printers(
+    name: str | None = Query(None, description="Only return printers with this exact name"),
+    db: AsyncSession = Depends(get_db),
+):
     """List all configured printers."""
-    result = await db.execute(select(Printer).order_by(Printer.name))
+    query = select(Printer).order_by(Printer.name)
+    if name is not None:
+        query = query.where(Printer.name == name)
+    result = await db.execute(query)
     return list(result.scalars().all())
 
 
@@ -354,7 +354,8 @@ class BambuMQTTClient:
 
     def _on_message(self, client, userdata, msg):
         try:
-            payload = json.loads(msg.payload.decode())
+            # json.loads detects the encoding of the raw bytes itself
+            payload = json.loads(msg.payload)
             # Track last message time - receiving a message proves we're connected
             self._last_message_time = time.time()
             self.state.connected = True
@@ -16,6 +16,7 @@ import os
 import re
 import socket
 import struct
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -53,18 +54,31 @@ BAMBU_SEARCH_TARGET = "urn:bambulab-com:device:3dprinter:1"
 # All virtual printer serials end with this suffix, regardless of model
 VIRTUAL_PRINTER_SERIAL_SUFFIX = "391800001"
 
-# SSDP M-SEARCH message
-SSDP_MSEARCH = (
+# SSDP M-SEARCH message (pre-encoded, it is re-sent every few seconds)
+SSDP_MSEARCH: bytes = (
     "M-SEARCH * HTTP/1.1\r\n"
     f"HOST: {SSDP_ADDR}:{SSDP_PORT}\r\n"
     'MAN: "ssdp:discover"\r\n'
     "MX: 3\r\n"
     f"ST: {BAMBU_SEARCH_TARGET}\r\n"
     "\r\n"
-)
+).encode("ascii")
 
+# SSDP header patterns, compiled once since they run for every received packet.
+# Headers are ASCII, so they match the raw datagram and only captures get decoded.
+_RE_BAMBU = re.compile(rb"bambulab", re.IGNORECASE)
+_RE_USN = re.compile(rb"USN:\s*(?:uuid:)?([^\s\r\n]+)", re.IGNORECASE)
+_RE_NAME = re.compile(rb"DevName\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", re.IGNORECASE)
+_RE_MODEL = re.compile(rb"DevModel\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", re.IGNORECASE)
+_RE_NT = re.compile(rb"NT:\s*urn:bambulab-com:device:([^:]+)", re.IGNORECASE)
 
-@dataclass
+
+def _header_value(match: re.Match[bytes]) -> str:
+    """Decode the captured value of an SSDP header match."""
+    return match.group(1).strip().decode("utf-8", errors="ignore")
+
+
+@dataclass(slots=True)
 class DiscoveredPrinter:
     """Represents a discovered Bambu Lab printer."""
 
@@ -84,11 +98,34 @@ class DiscoveredPrinter:
         }
 
 
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that feeds received SSDP packets to the discovery service."""
+
+    def __init__(self, service: "PrinterDiscoveryService"):
+        self._service = service
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received from {addr[0]}: {data[:100]!r}...")
+        self._service._handle_response(data, addr[0])
+
+    def error_received(self, exc: Exception):
+        logger.debug(f"SSDP receive error: {exc}")
+
+
 class PrinterDiscoveryService:
     """Service for discovering Bambu Lab printers on the network."""
 
+    # Cap on printers kept from one run; the oldest sighting is evicted first.
+    # Also caps the seen-IP set: once full, new IPs are simply parsed every time
+    MAX_DISCOVERED = 256
+
     def __init__(self):
-        self._discovered: dict[str, DiscoveredPrinter] = {}
+        self._discovered: OrderedDict[str, DiscoveredPrinter] = OrderedDict()
+        # IPs whose SSDP packets have already been parsed - printers re-broadcast
+        # NOTIFY constantly, so repeats are dropped before any regex work
+        self._seen_ips: set[str] = set()
+        self._response_cache: list[dict] | None = None
         self._running = False
         self._task: asyncio.Task | None = None
 
@@ -100,9 +137,17 @@ class PrinterDiscoveryService:
     def discovered_printers(self) -> list[DiscoveredPrinter]:
         return list(self._discovered.values())
 
+    def get_response_payload(self) -> list[dict]:
+        """Get discovered printers as API response dicts, cached until the set changes."""
+        if self._response_cache is None:
+            self._response_cache = [p.to_dict() for p in self._discovered.values()]
+        return self._response_cache
+
     def clear(self):
         """Clear discovered printers."""
         self._discovered.clear()
+        self._seen_ips.clear()
+        self._response_cache = None
 
     async def start(self, duration: float = 10.0):
         """Start discovery for a specified duration."""
@@ -111,6 +156,8 @@ class PrinterDiscoveryService:
 
         self._running = True
         self._discovered.clear()
+        self._seen_ips.clear()
+        self._response_cache = None
         self._task = asyncio.create_task(self._discover(duration))
 
     async def stop(self):
@@ -155,40 +202,12 @@ class PrinterDiscoveryService:
             # Enable broadcast
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
-            logger.info(f"Starting SSDP discovery on port {SSDP_PORT} for Bambu Lab printers...")
-
-            # Send initial M-SEARCH request to trigger responses
-            try:
-                sock.sendto(SSDP_MSEARCH.encode(), (SSDP_ADDR, SSDP_PORT))
-            except Exception as e:
-                logger.debug(f"M-SEARCH send error: {e}")
-
-            start_time = asyncio.get_event_loop().time()
-            last_send = start_time
-
-            while self._running and (asyncio.get_event_loop().time() - start_time) < duration:
-                # Try to receive data
-                try:
-                    data, addr = sock.recvfrom(4096)
-                    message = data.decode("utf-8", errors="ignore")
-                    logger.debug(f"Received from {addr[0]}: {message[:100]}...")
-                    self._handle_response(message, addr[0])
-                except BlockingIOError:
-                    # No data available, that's fine
-                    pass
-                except Exception as e:
-                    logger.debug(f"SSDP receive error: {e}")
+            # Let M-SEARCH cross a few routed hops (default TTL of 1 stays on the local segment)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 4)
 
-                # Re-send M-SEARCH every 3 seconds
-                now = asyncio.get_event_loop().time()
-                if now - last_send >= 3.0:
-                    try:
-                        sock.sendto(SSDP_MSEARCH.encode(), (SSDP_ADDR, SSDP_PORT))
-                        last_send = now
-                    except Exception as e:
-                        logger.debug(f"SSDP send error: {e}")
+            logger.info(f"Starting SSDP discovery on port {SSDP_PORT} for Bambu Lab printers...")
 
-                await asyncio.sleep(0.1)
+            await self._run_ssdp_loop(sock, duration, resend_every=3.0)
 
             logger.info(f"Discovery complete. Found {len(self._discovered)} printers.")
 
@@ -205,7 +224,7 @@ class PrinterDiscoveryService:
             if sock:
                 try:
                     sock.close()
-                except Exception:
+                except OSError:
                     pass
 
     async def _discover_alternative(self, duration: float):
@@ -221,30 +240,11 @@ class PrinterDiscoveryService:
             mreq = struct.pack("4sl", socket.inet_aton(SSDP_ADDR), socket.INADDR_ANY)
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 4)
 
             logger.info("Using alternative discovery method...")
 
-            start_time = asyncio.get_event_loop().time()
-            last_send = start_time
-
-            while self._running and (asyncio.get_event_loop().time() - start_time) < duration:
-                try:
-                    data, addr = sock.recvfrom(4096)
-                    self._handle_response(data.decode("utf-8", errors="ignore"), addr[0])
-                except BlockingIOError:
-                    pass
-                except Exception as e:
-                    logger.debug(f"SSDP receive error: {e}")
-
-                now = asyncio.get_event_loop().time()
-                if now - last_send >= 2.0:
-                    try:
-                        sock.sendto(SSDP_MSEARCH.encode(), (SSDP_ADDR, SSDP_PORT))
-                        last_send = now
-                    except Exception:
-                        pass
-
-                await asyncio.sleep(0.1)
+            await self._run_ssdp_loop(sock, duration, resend_every=2.0)
 
             logger.info(f"Alternative discovery complete. Found {len(self._discovered)} printers.")
         except Exception as e:
@@ -253,51 +253,85 @@ class PrinterDiscoveryService:
             if sock:
                 try:
                     sock.close()
-                except Exception:
+                except OSError:
                     pass
 
-    def _handle_response(self, response: str, ip_address: str):
-        """Parse SSDP response and extract printer info."""
+    async def _run_ssdp_loop(self, sock: socket.socket, duration: float, resend_every: float):
+        """Receive SSDP packets on a bound non-blocking socket for the given duration.
+
+        Sends an M-SEARCH straight away and re-sends it every `resend_every` seconds.
+        The socket goes through a datagram endpoint rather than add_reader, so this
+        also runs on proactor event loops (the Windows default). The endpoint closes
+        the socket when the loop ends; the caller's own close() is then a no-op.
+        """
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+
+        # Hand the socket to the event loop so packets are delivered as they arrive
+        transport, _ = await loop.create_datagram_endpoint(lambda: _SSDPProtocol(self), sock=sock)
+
+        def _resend():
+            nonlocal resend_handle
+            transport.sendto(SSDP_MSEARCH, (SSDP_ADDR, SSDP_PORT))
+            resend_handle = loop.call_later(resend_every, _resend)
+
+        resend_handle = None
+        _resend()
+        done_handle = loop.call_later(duration, done.set)
+        try:
+            await done.wait()
+        finally:
+            resend_handle.cancel()
+            done_handle.cancel()
+            transport.close()
+
+    def _handle_response(self, response: bytes, ip_address: str):
+        """Parse a raw SSDP datagram and extract printer info."""
+        if ip_address in self._seen_ips:
+            return
+
         # Check if it's a Bambu Lab printer response
-        if BAMBU_SEARCH_TARGET not in response and "bambulab" not in response.lower():
+        if not _RE_BAMBU.search(response):
             logger.debug(f"Ignoring non-Bambu response from {ip_address}")
             return
 
         # Extract USN (Unique Service Name) which contains the serial
         # Bambu format is just "USN: SERIALNUMBER" (no uuid: prefix)
-        usn_match = re.search(r"USN:\s*(?:uuid:)?([^\s\r\n]+)", response, re.IGNORECASE)
+        usn_match = _RE_USN.search(response)
         if not usn_match:
             logger.debug(f"No USN found in response from {ip_address}")
             return
 
-        serial = usn_match.group(1).strip()
+        serial = _header_value(usn_match)
+        if len(self._seen_ips) < self.MAX_DISCOVERED:
+            self._seen_ips.add(ip_address)
 
         # Skip Bambuddy's own virtual printer (any model variant)
         if serial.endswith(VIRTUAL_PRINTER_SERIAL_SUFFIX):
             logger.debug(f"Ignoring Bambuddy virtual printer at {ip_address}")
             return
 
+        # Skip if already discovered
+        if serial in self._discovered:
+            return
+
         # Extract device name from LOCATION or DevName header
         name = serial  # Default to serial if no name found
-        name_match = re.search(r"DevName\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", response, re.IGNORECASE)
+        name_match = _RE_NAME.search(response)
         if name_match:
-            name = name_match.group(1).strip()
+            name = _header_value(name_match)
 
         # Try to extract model from DevModel header
         model = None
-        model_match = re.search(r"DevModel\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", response, re.IGNORECASE)
+        model_match = _RE_MODEL.search(response)
         if model_match:
-            model = model_match.group(1).strip()
+            model = _header_value(model_match)
 
         # Also try NT header for model
         if not model:
-            nt_match = re.search(r"NT:\s*urn:bambulab-com:device:([^:]+)", response, re.IGNORECASE)
+            nt_match = _RE_NT.search(response)
             if nt_match:
-                model = nt_match.group(1).strip()
-
-        # Skip if already discovered
-        if serial in self._discovered:
-            return
+                model = _header_value(nt_match)
 
         printer = DiscoveredPrinter(
             serial=serial,
@@ -308,6 +342,9 @@ class PrinterDiscoveryService:
         )
 
         self._discovered[serial] = printer
+        if len(self._discovered) > self.MAX_DISCOVERED:
+            self._discovered.popitem(last=False)
+        self._response_cache = None
         logger.info(f"Discovered printer: {name} ({serial}) at {ip_address}")
 
 
@@ -320,6 +357,7 @@ class SubnetScanner:
 
     def __init__(self):
         self._discovered: dict[str, DiscoveredPrinter] = {}
+        self._response_cache: list[dict] | None = None
         self._running = False
         self._scanned = 0
         self._total = 0
@@ -332,6 +370,12 @@ class SubnetScanner:
     def discovered_printers(self) -> list[DiscoveredPrinter]:
         return list(self._discovered.values())
 
+    def get_response_payload(self) -> list[dict]:
+        """Get discovered printers as API response dicts, cached until the set changes."""
+        if self._response_cache is None:
+            self._response_cache = [p.to_dict() for p in self._discovered.values()]
+        return self._response_cache
+
     @property
     def progress(self) -> tuple[int, int]:
         """Return (scanned, total) counts."""
@@ -352,6 +396,7 @@ class SubnetScanner:
 
         self._running = True
         self._discovered.clear()
+        self._response_cache = None
         self._scanned = 0
 
         try:
@@ -417,6 +462,7 @@ class SubnetScanner:
             discovered_at=datetime.now().isoformat(),
         )
         self._discovered[ip] = printer
+        self._response_cache = None
 
     async def _get_printer_info_ssdp(self, ip: str, timeout: float) -> tuple[str | None, str | None, str | None]:
         """Try to get printer info via SSDP unicast query."""
@@ -440,8 +486,7 @@ class SubnetScanner:
                 sock.sendto(msearch.encode(), (ip, SSDP_PORT))
 
                 # Wait for response
-                data, _ = sock.recvfrom(4096)
-                response = data.decode("utf-8", errors="ignore")
+                response, _ = sock.recvfrom(4096)
                 sock.close()
 
                 # Parse response
@@ -449,17 +494,17 @@ class SubnetScanner:
                 name = None
                 model = None
 
-                usn_match = re.search(r"USN:\s*(?:uuid:)?([^\s\r\n]+)", response, re.IGNORECASE)
+                usn_match = _RE_USN.search(response)
                 if usn_match:
-                    serial = usn_match.group(1).strip()
+                    serial = _header_value(usn_match)
 
-                name_match = re.search(r"DevName\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", response, re.IGNORECASE)
+                name_match = _RE_NAME.search(response)
                 if name_match:
-                    name = name_match.group(1).strip()
+                    name = _header_value(name_match)
 
-                model_match = re.search(r"DevModel\.bambu\.com:\s*(.+?)(?:\r\n|\n|$)", response, re.IGNORECASE)
+                model_match = _RE_MODEL.search(response)
                 if model_match:
-                    model = model_match.group(1).strip()
+                    model = _header_value(model_match)
 
                 logger.debug(f"SSDP info from {ip}: serial={serial}, name={name}, model={model}")
                 return serial, name, model
@@ -1,6 +1,5 @@
 """Shared test fixtures for BamBuddy backend tests."""
 
-import asyncio
 import json
 import logging
 import os
@@ -17,7 +16,9 @@ os.environ["LOG_TO_FILE"] = "false"
 os.environ["DEBUG"] = "false"
 
 from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
 
 # Ensure settings use our env vars - import and override before database import
 from backend.app.core.config import settings  # noqa: E402
@@ -26,22 +27,33 @@ settings.log_to_file = False
 
 from backend.app.core.database import Base  # noqa: E402
 
-# Use in-memory SQLite for tests
+# Use in-memory SQLite for tests; each xdist worker process gets its own database
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+async def shared_engine():
+    """Create the in-memory test database once per session.
 
+    StaticPool keeps a single connection open, so the in-memory database (and
+    its schema) survives for the whole session.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 
-@pytest.fixture
-async def test_engine():
-    """Create a test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    # pysqlite/aiosqlite manage transactions themselves and break SAVEPOINT;
+    # hand control to SQLAlchemy so per-test rollback isolation works
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     # Import all models to register them
     from backend.app.models import (
@@ -66,45 +78,80 @@ async def test_engine():
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
 @pytest.fixture
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def test_session_maker(request, shared_engine) -> AsyncGenerator[async_sessionmaker, None]:
+    """Session factory for the current test, isolated from other tests.
+
+    All sessions share one connection inside an outer transaction that is rolled
+    back after the test; session commits only release a SAVEPOINT. Tests marked
+    `fresh_db` get their own throwaway database with real commits instead.
+    """
+    if request.node.get_closest_marker("fresh_db"):
+        engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        await engine.dispose()
+        return
+
+    async with shared_engine.connect() as conn:
+        trans = await conn.begin()
+        yield async_sessionmaker(
+            conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await trans.rollback()
+
+
+@pytest.fixture
+async def db_session(test_session_maker) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session."""
-    async_session_maker = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session_maker() as session:
+    async with test_session_maker() as session:
         yield session
 
 
+@pytest.fixture(scope="session")
+async def asgi_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one ASGI client shared by every test in the session.
+
+    Tests should use `async_client`, which wires the per-test database into the
+    app before handing out this client.
+    """
+    from backend.app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
 @pytest.fixture
-async def async_client(test_engine, db_session) -> AsyncGenerator[AsyncClient, None]:
+async def async_client(asgi_client, test_session_maker, db_session) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client."""
     from backend.app.core.database import async_session, get_db
     from backend.app.main import app
-
-    # Create a new session maker for the test engine
-    test_async_session = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    from backend.app.services.printer_manager import printer_manager
 
     async def override_get_db():
-        async with test_async_session() as session:
+        async with test_session_maker() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    # Mock init_printer_connections to prevent MQTT connection attempts during tests
-    async def mock_init_printer_connections(db):
-        pass  # No-op - don't connect to real printers
-
-    # Also patch the module-level async_session used by services
+    # Also patch the module-level async_session used by services.
+    # The ASGI transport never runs the app lifespan, but printer create/update
+    # routes still call connect_printer; stub it so no MQTT client threads are
+    # started against the fake printer addresses.
     with (
-        patch("backend.app.core.database.async_session", test_async_session),
-        patch("backend.app.main.init_printer_connections", mock_init_printer_connections),
+        patch("backend.app.core.database.async_session", test_session_maker),
+        patch.object(printer_manager, "connect_printer", AsyncMock(return_value=False)),
     ):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            yield client
+        yield asgi_client
 
     app.dependency_overrides.clear()
 
@@ -207,6 +254,31 @@ def mock_printer_manager():
         yield mock
 
 
+@pytest.fixture
+def patched_printer_manager(monkeypatch):
+    """Replace the printer manager used by the printers API routes."""
+    mock_pm = MagicMock()
+    monkeypatch.setattr("backend.app.api.routes.printers.printer_manager", mock_pm)
+    return mock_pm
+
+
+@pytest.fixture
+def mock_bambu_client():
+    """Connected printer client with successful print-control defaults.
+
+    Specced against BambuMQTTClient, so a call the real client doesn't
+    support fails instead of silently returning a new mock.
+    """
+    from backend.app.services.bambu_mqtt import BambuMQTTClient
+
+    client = MagicMock(spec=BambuMQTTClient)
+    client.stop_print.return_value = True
+    client.pause_print.return_value = True
+    client.resume_print.return_value = True
+    client.ams_refresh_tray.return_value = (True, "")
+    return client
+
+
 # ============================================================================
 # Factory Fixtures for Test Data
 # ============================================================================
@@ -243,13 +315,22 @@ def smart_plug_factory(db_session):
 
 
 @pytest.fixture
-def printer_factory(db_session):
-    """Factory to create test printers."""
-    _counter = [0]  # Use list to allow mutation in nested function
+def printer_factory(request, db_session):
+    """Factory to create test printers.
 
-    async def _create_printer(**kwargs):
-        from backend.app.models.printer import Printer
+    Pass keyword overrides for one printer, or a list of override dicts to
+    insert several in one statement. Rows come back fully loaded via
+    INSERT ... RETURNING; they are only committed for `fresh_db` tests, since
+    under rollback isolation every session already shares the transaction.
+    """
+    from sqlalchemy import insert
 
+    from backend.app.models.printer import Printer
+
+    _counter = [0]  # Use list to allow mutation in nested function
+    commit = request.node.get_closest_marker("fresh_db") is not None
+
+    def _row(overrides):
         _counter[0] += 1
         counter = _counter[0]
 
@@ -262,17 +343,54 @@ def printer_factory(db_session):
             "auto_archive": True,
             "model": "X1C",
         }
-        defaults.update(kwargs)
+        defaults.update(overrides)
+        return defaults
 
-        printer = Printer(**defaults)
-        db_session.add(printer)
-        await db_session.commit()
-        await db_session.refresh(printer)
-        return printer
+    async def _create_printer(rows: list[dict] | None = None, **kwargs):
+        batch = [_row(r) for r in rows] if rows is not None else [_row(kwargs)]
+        printers = list(await db_session.scalars(insert(Printer).returning(Printer), batch))
+        if commit:
+            await db_session.commit()
+        return printers if rows is not None else printers[0]
 
     return _create_printer
 
 
+@pytest.fixture(scope="module")
+async def seeded_printer(shared_engine):
+    """One printer shared by the read-only tests of a module.
+
+    Committed outside the per-test rollback, so once created the row is visible
+    to every later test in the module - not just those that request it - until
+    the module finishes. Tests that need an empty table should use `fresh_db`.
+    """
+    from sqlalchemy import delete, insert
+
+    from backend.app.models.printer import Printer
+
+    async with async_sessionmaker(shared_engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        printer = await session.scalar(
+            insert(Printer).returning(Printer),
+            [
+                {
+                    "name": "Seeded Printer",
+                    "serial_number": "00M09A900000001",
+                    "ip_address": "192.168.1.250",
+                    "access_code": "12345678",
+                    "is_active": True,
+                    "auto_archive": True,
+                    "model": "X1C",
+                }
+            ],
+        )
+        await session.commit()
+
+    yield printer
+
+    async with shared_engine.begin() as conn:
+        await conn.execute(delete(Printer).where(Printer.id == printer.id))
+
+
 @pytest.fixture
 def notification_provider_factory(db_session):
     """Factory to create test notification providers."""
@@ -77,6 +77,31 @@ class TestDiscoveryAPI:
         data = response.json()
         assert isinstance(data, list)
 
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_get_discovered_printers_merges_sources(self, async_client: AsyncClient):
+        """Verify SSDP and subnet scan results are merged by IP, SSDP first."""
+        from backend.app.services.discovery import DiscoveredPrinter, discovery_service, subnet_scanner
+
+        ssdp_printer = DiscoveredPrinter(serial="01P00A123456789", name="SSDP Printer", ip_address="192.168.1.50")
+        duplicate = DiscoveredPrinter(
+            serial="unknown-192-168-1-50", name="Printer at 192.168.1.50", ip_address="192.168.1.50"
+        )
+        scanned = DiscoveredPrinter(serial="01S00A123456789", name="Scanned Printer", ip_address="192.168.1.51")
+
+        with (
+            patch.object(discovery_service, "_discovered", {ssdp_printer.serial: ssdp_printer}),
+            patch.object(discovery_service, "_response_cache", None),
+            patch.object(subnet_scanner, "_discovered", {"192.168.1.50": duplicate, "192.168.1.51": scanned}),
+            patch.object(subnet_scanner, "_response_cache", None),
+        ):
+            response = await async_client.get("/api/v1/discovery/printers")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["name"] for p in data] == ["SSDP Printer", "Scanned Printer"]
+        assert data[0] == ssdp_printer.to_dict()
+
     # ========================================================================
     # Subnet scanning endpoints
     # ========================================================================
@@ -8,7 +8,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from httpx import AsyncClient
 
-
+from backend.app.models.printer import Printer
+
+NEW_PRINTER_BODY = {
+    "name": "New Printer",
+    "serial_number": "00M09A111111111",
+    "ip_address": "192.168.1.100",
+    "access_code": "12345678",
+    "is_active": True,
+    "model": "X1C",
+}
+
+DUPLICATE_SERIAL_BODY = {
+    "name": "Duplicate Printer",
+    "serial_number": "00M09A222222222",
+    "ip_address": "192.168.1.101",
+    "access_code": "12345678",
+}
+
+
+@pytest.mark.xdist_group(name="TestPrintersAPI")
 class TestPrintersAPI:
     """Integration tests for /api/v1/printers/ endpoints."""
 
@@ -18,6 +37,7 @@ class TestPrintersAPI:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.fresh_db
     async def test_list_printers_empty(self, async_client: AsyncClient):
         """Verify empty list is returned when no printers exist."""
         response = await async_client.get("/api/v1/printers/")
@@ -28,15 +48,22 @@ class TestPrintersAPI:
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_list_printers_with_data(self, async_client: AsyncClient, printer_factory, db_session):
-        """Verify list returns existing printers."""
-        await printer_factory(name="Test Printer")
+        """Verify list returns existing printers sorted by name, and can filter by name."""
+        await printer_factory([{"name": "Test Printer"}, {"name": "Second Printer"}])
 
         response = await async_client.get("/api/v1/printers/")
 
+        assert response.status_code == 200
+        names = [p["name"] for p in response.json()]
+        assert names == sorted(names)
+        assert {"Test Printer", "Second Printer"} <= set(names)
+
+        response = await async_client.get("/api/v1/printers/", params={"name": "Test Printer"})
+
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= 1
-        assert any(p["name"] == "Test Printer" for p in data)
+        assert len(data) == 1
+        assert data[0]["name"] == "Test Printer"
 
     # ========================================================================
     # Create endpoints
@@ -46,16 +73,7 @@ class TestPrintersAPI:
     @pytest.mark.integration
     async def test_create_printer(self, async_client: AsyncClient):
         """Verify printer can be created."""
-        data = {
-            "name": "New Printer",
-            "serial_number": "00M09A111111111",
-            "ip_address": "192.168.1.100",
-            "access_code": "12345678",
-            "is_active": True,
-            "model": "X1C",
-        }
-
-        response = await async_client.post("/api/v1/printers/", json=data)
+        response = await async_client.post("/api/v1/printers/", json=NEW_PRINTER_BODY)
 
         assert response.status_code == 200
         result = response.json()
@@ -65,18 +83,12 @@ class TestPrintersAPI:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.fresh_db
     async def test_create_printer_duplicate_serial(self, async_client: AsyncClient, printer_factory, db_session):
         """Verify duplicate serial number is rejected."""
-        await printer_factory(serial_number="00M09A222222222")
+        await printer_factory(serial_number=DUPLICATE_SERIAL_BODY["serial_number"])
 
-        data = {
-            "name": "Duplicate Printer",
-            "serial_number": "00M09A222222222",
-            "ip_address": "192.168.1.101",
-            "access_code": "12345678",
-        }
-
-        response = await async_client.post("/api/v1/printers/", json=data)
+        response = await async_client.post("/api/v1/printers/", json=DUPLICATE_SERIAL_BODY)
 
         # Should fail due to duplicate serial
         assert response.status_code in [400, 409, 422, 500]
@@ -87,22 +99,34 @@ class TestPrintersAPI:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_get_printer(self, async_client: AsyncClient, printer_factory, db_session):
+    async def test_get_printer(self, async_client: AsyncClient, seeded_printer):
         """Verify single printer can be retrieved."""
-        printer = await printer_factory(name="Get Test Printer")
-
-        response = await async_client.get(f"/api/v1/printers/{printer.id}")
+        response = await async_client.get(f"/api/v1/printers/{seeded_printer.id}")
 
         assert response.status_code == 200
         result = response.json()
-        assert result["id"] == printer.id
-        assert result["name"] == "Get Test Printer"
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_get_printer_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.get("/api/v1/printers/9999")
+        assert result["id"] == seeded_printer.id
+        assert result["name"] == "Seeded Printer"
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "method,path,json",
+        [
+            ("GET", "/api/v1/printers/9999", None),
+            ("PATCH", "/api/v1/printers/9999", {"name": "New Name"}),
+            ("DELETE", "/api/v1/printers/9999", None),
+            ("GET", "/api/v1/printers/9999/status", None),
+            ("POST", "/api/v1/printers/99999/refresh-status", None),
+            ("POST", "/api/v1/printers/99999/print/stop", None),
+            ("POST", "/api/v1/printers/99999/print/pause", None),
+            ("POST", "/api/v1/printers/99999/print/resume", None),
+            ("POST", "/api/v1/printers/99999/ams/0/slot/0/refresh", None),
+        ],
+    )
+    async def test_nonexistent_printer_returns_404(self, async_client: AsyncClient, method, path, json):
+        """Verify endpoints return 404 for a non-existent printer."""
+        response = await async_client.request(method, path, json=json)
 
         assert response.status_code == 404
 
@@ -112,44 +136,15 @@ class TestPrintersAPI:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_update_printer_name(self, async_client: AsyncClient, printer_factory, db_session):
-        """Verify printer name can be updated."""
-        printer = await printer_factory(name="Original Name")
-
-        response = await async_client.patch(f"/api/v1/printers/{printer.id}", json={"name": "Updated Name"})
+    async def test_update_printer_fields_scenario(self, async_client: AsyncClient, printer_factory):
+        """Verify name, active status and auto_archive can each be updated."""
+        printer = await printer_factory(name="Original Name", is_active=True, auto_archive=True)
 
-        assert response.status_code == 200
-        assert response.json()["name"] == "Updated Name"
+        for field, value in [("name", "Updated Name"), ("is_active", False), ("auto_archive", False)]:
+            response = await async_client.patch(f"/api/v1/printers/{printer.id}", json={field: value})
 
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_update_printer_active_status(self, async_client: AsyncClient, printer_factory, db_session):
-        """Verify printer active status can be updated."""
-        printer = await printer_factory(is_active=True)
-
-        response = await async_client.patch(f"/api/v1/printers/{printer.id}", json={"is_active": False})
-
-        assert response.status_code == 200
-        assert response.json()["is_active"] is False
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_update_printer_auto_archive(self, async_client: AsyncClient, printer_factory, db_session):
-        """Verify auto_archive setting can be updated."""
-        printer = await printer_factory(auto_archive=True)
-
-        response = await async_client.patch(f"/api/v1/printers/{printer.id}", json={"auto_archive": False})
-
-        assert response.status_code == 200
-        assert response.json()["auto_archive"] is False
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_update_nonexistent_printer(self, async_client: AsyncClient):
-        """Verify updating non-existent printer returns 404."""
-        response = await async_client.patch("/api/v1/printers/9999", json={"name": "New Name"})
-
-        assert response.status_code == 404
+            assert response.status_code == 200, field
+            assert response.json()[field] == value, field
 
     # ========================================================================
     # Delete endpoints
@@ -167,16 +162,8 @@ class TestPrintersAPI:
         assert response.status_code == 200
 
         # Verify deleted
-        response = await async_client.get(f"/api/v1/printers/{printer_id}")
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_delete_nonexistent_printer(self, async_client: AsyncClient):
-        """Verify deleting non-existent printer returns 404."""
-        response = await async_client.delete("/api/v1/printers/9999")
-
-        assert response.status_code == 404
+        db_session.expire_all()
+        assert await db_session.get(Printer, printer_id) is None
 
     # ========================================================================
     # Status endpoint
@@ -184,32 +171,21 @@ class TestPrintersAPI:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_get_printer_status(
-        self, async_client: AsyncClient, printer_factory, mock_printer_manager, db_session
-    ):
+    async def test_get_printer_status(self, async_client: AsyncClient, seeded_printer, mock_printer_manager):
         """Verify printer status can be retrieved."""
-        printer = await printer_factory()
-
-        response = await async_client.get(f"/api/v1/printers/{printer.id}/status")
+        response = await async_client.get(f"/api/v1/printers/{seeded_printer.id}/status")
 
         assert response.status_code == 200
         result = response.json()
         assert "connected" in result
         assert "state" in result
 
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_get_printer_status_not_found(self, async_client: AsyncClient):
-        """Verify 404 for status of non-existent printer."""
-        response = await async_client.get("/api/v1/printers/9999/status")
-
-        assert response.status_code == 404
-
     # ========================================================================
     # Test connection endpoint
     # ========================================================================
 
 
+@pytest.mark.xdist_group(name="TestPrinterDataIntegrity")
 class TestPrinterDataIntegrity:
     """Tests for printer data integrity."""
 
@@ -242,15 +218,16 @@ class TestPrinterDataIntegrity:
     async def test_printer_update_persists(self, async_client: AsyncClient, printer_factory, db_session):
         """CRITICAL: Verify printer updates persist."""
         printer = await printer_factory(name="Original", is_active=True)
+        printer_id = printer.id
 
         # Update
-        await async_client.patch(f"/api/v1/printers/{printer.id}", json={"name": "Updated", "is_active": False})
+        await async_client.patch(f"/api/v1/printers/{printer_id}", json={"name": "Updated", "is_active": False})
 
         # Verify persistence
-        response = await async_client.get(f"/api/v1/printers/{printer.id}")
-        result = response.json()
-        assert result["name"] == "Updated"
-        assert result["is_active"] is False
+        db_session.expire_all()
+        result = await db_session.get(Printer, printer_id)
+        assert result.name == "Updated"
+        assert result.is_active is False
 
     # ========================================================================
     # Refresh status endpoint
@@ -258,235 +235,118 @@ class TestPrinterDataIntegrity:
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_refresh_status_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.post("/api/v1/printers/99999/refresh-status")
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_refresh_status_not_connected(self, async_client: AsyncClient, printer_factory):
+    async def test_refresh_status_not_connected(
+        self, async_client: AsyncClient, seeded_printer, patched_printer_manager
+    ):
         """Verify 400 when printer is not connected."""
-        printer = await printer_factory(name="Disconnected Printer")
+        patched_printer_manager.request_status_update.return_value = False
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.request_status_update.return_value = False
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/refresh-status")
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/refresh-status")
 
-            assert response.status_code == 400
-            assert "not connected" in response.json()["detail"].lower()
+        assert response.status_code == 400
+        assert "not connected" in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_refresh_status_success(self, async_client: AsyncClient, printer_factory):
+    async def test_refresh_status_success(self, async_client: AsyncClient, printer_factory, patched_printer_manager):
         """Verify successful refresh request."""
         printer = await printer_factory(name="Connected Printer")
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.request_status_update.return_value = True
+        patched_printer_manager.request_status_update.return_value = True
 
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/refresh-status")
+        response = await async_client.post(f"/api/v1/printers/{printer.id}/refresh-status")
 
-            assert response.status_code == 200
-            assert response.json()["status"] == "refresh_requested"
-            mock_pm.request_status_update.assert_called_once_with(printer.id)
+        assert response.status_code == 200
+        assert response.json()["status"] == "refresh_requested"
+        patched_printer_manager.request_status_update.assert_called_once_with(printer.id)
 
 
+@pytest.mark.xdist_group(name="TestPrintControlAPI")
 class TestPrintControlAPI:
-    """Integration tests for print control endpoints (stop, pause, resume)."""
-
-    # ========================================================================
-    # Stop print endpoint
-    # ========================================================================
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_stop_print_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.post("/api/v1/printers/99999/print/stop")
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_stop_print_not_connected(self, async_client: AsyncClient, printer_factory):
-        """Verify error when printer is not connected."""
-        printer = await printer_factory(name="Disconnected Printer")
-
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = None
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/stop")
-
-            assert response.status_code == 400
-            assert "not connected" in response.json()["detail"].lower()
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_stop_print_success(self, async_client: AsyncClient, printer_factory):
-        """Verify successful stop print request."""
-        printer = await printer_factory(name="Printing Printer")
-
-        mock_client = MagicMock()
-        mock_client.stop_print.return_value = True
+    """Integration tests for print control endpoints (stop, pause, resume).
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = mock_client
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/stop")
-
-            assert response.status_code == 200
-            assert response.json()["success"] is True
-            mock_client.stop_print.assert_called_once()
-
-    # ========================================================================
-    # Pause print endpoint
-    # ========================================================================
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_pause_print_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.post("/api/v1/printers/99999/print/pause")
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_pause_print_not_connected(self, async_client: AsyncClient, printer_factory):
-        """Verify error when printer is not connected."""
-        printer = await printer_factory(name="Disconnected Printer")
-
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = None
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/pause")
-
-            assert response.status_code == 400
-            assert "not connected" in response.json()["detail"].lower()
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_pause_print_success(self, async_client: AsyncClient, printer_factory):
-        """Verify successful pause print request."""
-        printer = await printer_factory(name="Printing Printer")
-
-        mock_client = MagicMock()
-        mock_client.pause_print.return_value = True
-
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = mock_client
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/pause")
-
-            assert response.status_code == 200
-            assert response.json()["success"] is True
-            mock_client.pause_print.assert_called_once()
-
-    # ========================================================================
-    # Resume print endpoint
-    # ========================================================================
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_resume_print_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.post("/api/v1/printers/99999/print/resume")
-        assert response.status_code == 404
+    Non-existent printers are covered by test_nonexistent_printer_returns_404.
+    """
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_resume_print_not_connected(self, async_client: AsyncClient, printer_factory):
+    @pytest.mark.parametrize("action", ["stop", "pause", "resume"])
+    async def test_print_action_not_connected(
+        self, async_client: AsyncClient, seeded_printer, patched_printer_manager, action
+    ):
         """Verify error when printer is not connected."""
-        printer = await printer_factory(name="Disconnected Printer")
+        patched_printer_manager.get_client.return_value = None
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = None
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/print/{action}")
 
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/resume")
-
-            assert response.status_code == 400
-            assert "not connected" in response.json()["detail"].lower()
+        assert response.status_code == 400
+        assert "not connected" in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_resume_print_success(self, async_client: AsyncClient, printer_factory):
-        """Verify successful resume print request."""
-        printer = await printer_factory(name="Paused Printer")
-
-        mock_client = MagicMock()
-        mock_client.resume_print.return_value = True
-
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = mock_client
+    @pytest.mark.parametrize(
+        "action,method", [("stop", "stop_print"), ("pause", "pause_print"), ("resume", "resume_print")]
+    )
+    async def test_print_action_success(
+        self, async_client: AsyncClient, seeded_printer, patched_printer_manager, mock_bambu_client, action, method
+    ):
+        """Verify successful print control request."""
+        patched_printer_manager.get_client.return_value = mock_bambu_client
 
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/print/resume")
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/print/{action}")
 
-            assert response.status_code == 200
-            assert response.json()["success"] is True
-            mock_client.resume_print.assert_called_once()
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        getattr(mock_bambu_client, method).assert_called_once()
 
 
+@pytest.mark.xdist_group(name="TestAMSRefreshAPI")
 class TestAMSRefreshAPI:
     """Integration tests for AMS slot refresh endpoint."""
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_ams_refresh_not_found(self, async_client: AsyncClient):
-        """Verify 404 for non-existent printer."""
-        response = await async_client.post("/api/v1/printers/99999/ams/0/slot/0/refresh")
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_ams_refresh_not_connected(self, async_client: AsyncClient, printer_factory):
+    async def test_ams_refresh_not_connected(self, async_client: AsyncClient, seeded_printer, patched_printer_manager):
         """Verify error when printer is not connected."""
-        printer = await printer_factory(name="Disconnected Printer")
-
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = None
+        patched_printer_manager.get_client.return_value = None
 
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/ams/0/slot/0/refresh")
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/ams/0/slot/0/refresh")
 
-            assert response.status_code == 400
-            assert "not connected" in response.json()["detail"].lower()
+        assert response.status_code == 400
+        assert "not connected" in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_ams_refresh_success(self, async_client: AsyncClient, printer_factory):
+    async def test_ams_refresh_success(
+        self, async_client: AsyncClient, seeded_printer, patched_printer_manager, mock_bambu_client
+    ):
         """Verify successful AMS refresh request."""
-        printer = await printer_factory(name="Printer with AMS")
+        mock_bambu_client.ams_refresh_tray.return_value = (True, "Refreshing AMS 0 tray 1")
+        patched_printer_manager.get_client.return_value = mock_bambu_client
 
-        mock_client = MagicMock()
-        mock_client.ams_refresh_tray.return_value = (True, "Refreshing AMS 0 tray 1")
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/ams/0/slot/1/refresh")
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = mock_client
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/ams/0/slot/1/refresh")
-
-            assert response.status_code == 200
-            result = response.json()
-            assert result["success"] is True
-            mock_client.ams_refresh_tray.assert_called_once_with(0, 1)
+        assert response.status_code == 200
+        result = response.json()
+        assert result["success"] is True
+        mock_bambu_client.ams_refresh_tray.assert_called_once_with(0, 1)
 
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_ams_refresh_filament_loaded(self, async_client: AsyncClient, printer_factory):
+    async def test_ams_refresh_filament_loaded(
+        self, async_client: AsyncClient, seeded_printer, patched_printer_manager, mock_bambu_client
+    ):
         """Verify error when filament is loaded (can't refresh while loaded)."""
-        printer = await printer_factory(name="Printer with AMS")
+        mock_bambu_client.ams_refresh_tray.return_value = (False, "Please unload filament first")
+        patched_printer_manager.get_client.return_value = mock_bambu_client
 
-        mock_client = MagicMock()
-        mock_client.ams_refresh_tray.return_value = (False, "Please unload filament first")
+        response = await async_client.post(f"/api/v1/printers/{seeded_printer.id}/ams/0/slot/0/refresh")
 
-        with patch("backend.app.api.routes.printers.printer_manager") as mock_pm:
-            mock_pm.get_client.return_value = mock_client
-
-            response = await async_client.post(f"/api/v1/printers/{printer.id}/ams/0/slot/0/refresh")
-
-            assert response.status_code == 400
-            assert "unload" in response.json()["detail"].lower()
+        assert response.status_code == 400
+        assert "unload" in response.json()["detail"].lower()
 
 
+@pytest.mark.xdist_group(name="TestSkipObjectsAPI")
 class TestSkipObjectsAPI:
     """Integration tests for skip objects endpoints."""
 
@@ -714,6 +574,7 @@ class TestSkipObjectsAPI:
             mock_client.skip_objects.assert_called_once_with([100, 200])
 
 
+@pytest.mark.xdist_group(name="TestChamberLightAPI")
 class TestChamberLightAPI:
     """Integration tests for chamber light control endpoint."""
 
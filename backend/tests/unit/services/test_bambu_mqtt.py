@@ -424,3 +424,39 @@ class TestRealisticMessageFlow:
 
         assert complete_data["timelapse_was_active"] is True
         assert complete_data["status"] == "failed"
+
+
+class TestOnMessage:
+    """Tests for raw MQTT message handling in _on_message."""
+
+    @pytest.fixture
+    def mqtt_client(self):
+        """Create a BambuMQTTClient instance for testing."""
+        from backend.app.services.bambu_mqtt import BambuMQTTClient
+
+        client = BambuMQTTClient(
+            ip_address="192.168.1.100",
+            serial_number="TEST123",
+            access_code="12345678",
+        )
+        client._payload_dumped = True  # Skip the one-off full payload dump
+        return client
+
+    def test_parses_raw_bytes_payload(self, mqtt_client):
+        """Verify the payload bytes are parsed without a separate decode step."""
+        msg = MagicMock(topic="device/TEST123/report", payload=b'{"print": {"gcode_state": "IDLE"}}')
+
+        with patch.object(mqtt_client, "_process_message") as mock_process:
+            mqtt_client._on_message(None, None, msg)
+
+        mock_process.assert_called_once_with({"print": {"gcode_state": "IDLE"}})
+        assert mqtt_client.state.connected is True
+
+    def test_ignores_invalid_json(self, mqtt_client):
+        """Verify malformed payloads are dropped without raising."""
+        msg = MagicMock(topic="device/TEST123/report", payload=b"{not json")
+
+        with patch.object(mqtt_client, "_process_message") as mock_process:
+            mqtt_client._on_message(None, None, msg)
+
+        mock_process.assert_not_called()
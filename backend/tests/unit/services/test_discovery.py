@@ -0,0 +1,205 @@
+"""Unit tests for PrinterDiscoveryService.
+
+Tests SSDP response parsing and packet delivery.
+"""
+
+import asyncio
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.services.discovery import PrinterDiscoveryService, _SSDPProtocol
+
+NOTIFY_PACKET = (
+    b"NOTIFY * HTTP/1.1\r\n"
+    b"HOST: 239.255.255.250:2021\r\n"
+    b"NT: urn:bambulab-com:device:3dprinter:1\r\n"
+    b"USN: 01P00A123456789\r\n"
+    b"DevModel.bambu.com: C11\r\n"
+    b"DevName.bambu.com: Workshop P1P\r\n"
+    b"\r\n"
+)
+
+
+class TestPrinterDiscoveryService:
+    """Tests for PrinterDiscoveryService class."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a PrinterDiscoveryService instance."""
+        return PrinterDiscoveryService()
+
+    # ========================================================================
+    # Tests for _handle_response
+    # ========================================================================
+
+    def test_handle_response_extracts_printer(self, service):
+        """Verify serial, name and model are parsed from a NOTIFY packet."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+
+        printers = service.discovered_printers
+        assert len(printers) == 1
+        assert printers[0].serial == "01P00A123456789"
+        assert printers[0].name == "Workshop P1P"
+        assert printers[0].model == "C11"
+        assert printers[0].ip_address == "192.168.1.50"
+
+    def test_handle_response_decodes_utf8_name(self, service):
+        """Verify non-ASCII device names survive parsing of the raw datagram."""
+        packet = NOTIFY_PACKET.replace(b"Workshop P1P", "Drucker Küche".encode())
+
+        service._handle_response(packet, "192.168.1.50")
+
+        assert service.discovered_printers[0].name == "Drucker Küche"
+
+    def test_handle_response_ignores_non_bambu(self, service):
+        """Verify non-Bambu SSDP traffic is ignored."""
+        service._handle_response(b"NOTIFY * HTTP/1.1\r\nUSN: uuid:router\r\n\r\n", "192.168.1.1")
+
+        assert service.discovered_printers == []
+
+    def test_handle_response_ignores_virtual_printer(self, service):
+        """Verify Bambuddy's own virtual printer is not reported."""
+        packet = NOTIFY_PACKET.replace(b"01P00A123456789", b"00M09A391800001")
+
+        service._handle_response(packet, "192.168.1.60")
+
+        assert service.discovered_printers == []
+
+    def test_handle_response_model_from_nt_header(self, service):
+        """Verify model falls back to the NT header when DevModel is missing."""
+        packet = b"NOTIFY * HTTP/1.1\r\nNT: urn:bambulab-com:device:3dprinter:1\r\nUSN: 01P00A123456789\r\n\r\n"
+
+        service._handle_response(packet, "192.168.1.50")
+
+        printer = service.discovered_printers[0]
+        assert printer.name == "01P00A123456789"
+        assert printer.model == "3dprinter"
+
+    def test_handle_response_keeps_first_sighting(self, service):
+        """Verify repeated NOTIFY packets don't overwrite the discovered printer."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+        first = service.discovered_printers[0]
+
+        service._handle_response(NOTIFY_PACKET.replace(b"Workshop P1P", b"Renamed"), "192.168.1.50")
+
+        assert service.discovered_printers == [first]
+
+    def test_handle_response_skips_seen_ip_before_parsing(self, service):
+        """Verify packets from an already-parsed IP skip regex parsing."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+
+        with patch("backend.app.services.discovery._RE_USN") as mock_usn:
+            service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+
+        mock_usn.search.assert_not_called()
+
+    def test_clear_forgets_seen_ips(self, service):
+        """Verify clear() allows a previously seen printer to be rediscovered."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+        service.clear()
+
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+
+        assert len(service.discovered_printers) == 1
+
+    def test_handle_response_evicts_oldest_over_cap(self, service):
+        """Verify the discovered set is bounded and drops the oldest printer first."""
+        service.MAX_DISCOVERED = 2
+
+        for i in range(3):
+            packet = NOTIFY_PACKET.replace(b"01P00A123456789", f"01P00A00000000{i}".encode())
+            service._handle_response(packet, f"192.168.1.{50 + i}")
+
+        assert [p.serial for p in service.discovered_printers] == ["01P00A000000001", "01P00A000000002"]
+
+    def test_handle_response_bounds_seen_ips(self, service):
+        """Verify the seen-IP set stops growing at the cap."""
+        service.MAX_DISCOVERED = 2
+
+        for i in range(3):
+            service._handle_response(NOTIFY_PACKET, f"192.168.1.{50 + i}")
+
+        assert service._seen_ips == {"192.168.1.50", "192.168.1.51"}
+
+    # ========================================================================
+    # Tests for get_response_payload
+    # ========================================================================
+
+    def test_response_payload_is_cached(self, service):
+        """Verify the payload is built once and reused while nothing changes."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+
+        payload = service.get_response_payload()
+
+        assert payload == [service.discovered_printers[0].to_dict()]
+        assert service.get_response_payload() is payload
+
+    def test_response_payload_invalidated_on_new_printer(self, service):
+        """Verify discovering another printer rebuilds the payload."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+        first = service.get_response_payload()
+
+        service._handle_response(NOTIFY_PACKET.replace(b"01P00A123456789", b"01P00A987654321"), "192.168.1.51")
+
+        assert len(service.get_response_payload()) == 2
+        assert len(first) == 1
+
+    def test_response_payload_invalidated_on_clear(self, service):
+        """Verify clear() empties the cached payload."""
+        service._handle_response(NOTIFY_PACKET, "192.168.1.50")
+        service.get_response_payload()
+
+        service.clear()
+
+        assert service.get_response_payload() == []
+
+    # ========================================================================
+    # Tests for _SSDPProtocol
+    # ========================================================================
+
+    def test_protocol_forwards_datagrams(self, service):
+        """Verify received datagrams are handed to the service with the sender IP."""
+        protocol = _SSDPProtocol(service)
+
+        with patch.object(service, "_handle_response") as mock_handle:
+            protocol.datagram_received(NOTIFY_PACKET, ("192.168.1.50", 2021))
+
+        mock_handle.assert_called_once_with(NOTIFY_PACKET, "192.168.1.50")
+
+    def test_protocol_ignores_receive_errors(self, service):
+        """Verify socket errors (e.g. ICMP port unreachable) are logged, not raised."""
+        protocol = _SSDPProtocol(service)
+
+        protocol.error_received(ConnectionRefusedError())
+
+    # ========================================================================
+    # Tests for _run_ssdp_loop
+    # ========================================================================
+
+    @pytest.mark.asyncio
+    async def test_run_ssdp_loop_discovers_and_cleans_up(self, service):
+        """Verify packets arriving during the loop are parsed and the socket is released afterwards."""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            receiver.bind(("127.0.0.1", 0))
+            receiver.setblocking(False)
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, sender.sendto, NOTIFY_PACKET, receiver.getsockname())
+
+            # Aim the M-SEARCH back at the receiver so nothing leaves loopback
+            host, port = receiver.getsockname()
+            with (
+                patch("backend.app.services.discovery.SSDP_ADDR", host),
+                patch("backend.app.services.discovery.SSDP_PORT", port),
+            ):
+                await service._run_ssdp_loop(receiver, duration=0.3, resend_every=1.0)
+
+            assert [p.serial for p in service.discovered_printers] == ["01P00A123456789"]
+            await asyncio.sleep(0)  # let the closed transport release the socket
+            assert receiver.fileno() == -1
+        finally:
+            receiver.close()
+            sender.close()